@@ -163,6 +163,7 @@ def build_executable():
         "sqlite3",
         "ftplib",
         "hashlib",
+        "argon2",
         "urllib",
         "urllib.request",
         "io",
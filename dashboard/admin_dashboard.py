@@ -738,7 +738,7 @@ class AdminDashboard:
                 size = size_entry.get().strip()
                 gender = gender_var.get()
 
-                if not all([article_name, mould, size]):
+                if not (article_name and mould and size):
                     messagebox.showerror("Error", "Please fill all required fields")
                     return
 
@@ -746,7 +746,7 @@ class AdminDashboard:
                 if self.selected_image_path:
                     status_label.config(text="Uploading image...", fg="blue")
                     dialog.update()
-                    image_url = self.ftp.upload_image(self.selected_image_path)
+                    image_url = self.ftp.upload_image(self.selected_image_path, max_retries=1)
                     if image_url:
                         status_label.config(text="Image uploaded!", fg="green")
                     dialog.update()
@@ -664,7 +664,7 @@ class UserDashboard:
                 size = size_entry.get().strip()
                 gender = gender_var.get()
 
-                if not all([article_name, mould, size]):
+                if not (article_name and mould and size):
                     messagebox.showerror("Error", "Please fill all required fields")
                     return
 
@@ -675,7 +675,7 @@ class UserDashboard:
                     status_label.config(text="⏳ Uploading image to FTP server...", fg="blue")
                     dialog.update()
                     
-                    ftp_path = self.ftp.upload_image(self.selected_image_path)
+                    ftp_path = self.ftp.upload_image(self.selected_image_path, max_retries=1)
                     
                     if not ftp_path:
                         status_label.config(text="❌ FTP upload failed!", fg="red")
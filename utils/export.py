@@ -6,8 +6,9 @@ Supports exporting articles and user data with embedded images
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
 from io import BytesIO
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -19,6 +20,7 @@ try:
     from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image as RLImage
     from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
     from reportlab.lib import colors
+    from reportlab.pdfgen import canvas
     HAS_REPORTLAB = True
 except ImportError:
     HAS_REPORTLAB = False
@@ -32,13 +34,54 @@ try:
 except ImportError:
     HAS_OPENPYXL = False
 
+try:
+    import xlsxwriter
+    HAS_XLSXWRITER = True
+except ImportError:
+    HAS_XLSXWRITER = False
+
 from PIL import Image
 from utils.logger import Logger
 
 
+def _make_excel_thumbnail(image_path: str, max_size: int = 160) -> Optional[BytesIO]:
+    """
+    Downscale an image and encode it for embedding in Excel
+
+    Pillow releases the GIL while decoding, resizing and encoding, so this
+    runs in parallel from a thread pool.
+
+    Args:
+        image_path: Local image file
+        max_size: Longest side of the thumbnail in pixels
+
+    Returns:
+        Encoded PNG/JPEG bytes, or None if the image cannot be read
+    """
+    try:
+        with Image.open(image_path) as img:
+            img.thumbnail((max_size, max_size))
+            buf = BytesIO()
+            if img.mode in ('RGBA', 'LA', 'P'):
+                img.save(buf, format='PNG', optimize=True)
+            else:
+                img.convert('RGB').save(buf, format='JPEG', quality=85)
+        buf.seek(0)
+        return buf
+    except Exception:
+        return None
+
+
 class ExportManager:
     """Manages data export to PDF and Excel formats with embedded images"""
 
+    # Above this many articles the PDF is drawn page by page with the canvas API
+    # instead of building the whole Platypus story in memory
+    PDF_STREAM_THRESHOLD = 2000
+    # Above this many articles (and with no images) Excel rows are streamed with
+    # xlsxwriter's constant-memory mode when it is installed
+    XLSX_STREAM_THRESHOLD = 5000
+
     def __init__(self):
         self.logger = Logger(__name__)
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -47,6 +90,10 @@ class ExportManager:
         self.PRIMARY_RGB = (31, 119, 212)  # From #1f77d4
         self.PRIMARY_HEX_EXCEL = "1f77d4"
         self.SECONDARY_HEX_EXCEL = "f0f0f0"
+        if HAS_REPORTLAB:
+            # Convert once; ReportLab colors are reused by every PDF export
+            self.PRIMARY_COLOR = colors.Color(*(c / 255.0 for c in self.PRIMARY_RGB))
+            self.SECONDARY_COLOR = colors.HexColor('#' + self.SECONDARY_HEX_EXCEL)
         
         # Import image_sync for FTP downloads
         try:
@@ -105,6 +152,12 @@ class ExportManager:
         Returns:
             Path to created Excel file
         """
+        # Only keep the image column when at least one article has an image
+        any_images = any(article.get('image_path') for article in articles)
+
+        if HAS_XLSXWRITER and not any_images and len(articles) > self.XLSX_STREAM_THRESHOLD:
+            return self._export_articles_to_xlsxwriter(articles, output_path)
+
         if not HAS_OPENPYXL:
             self.logger.error("openpyxl not installed. Install with: pip install openpyxl")
             raise ImportError("openpyxl is required for Excel export")
@@ -126,7 +179,9 @@ class ExportManager:
             )
 
             # Headers
-            headers = ["Image", "ID", "Article Name", "Mould", "Size", "Gender", "Created By", "Created Date", "Sync Status"]
+            headers = ["ID", "Article Name", "Mould", "Size", "Gender", "Created By", "Created Date", "Sync Status"]
+            if any_images:
+                headers.insert(0, "Image")
             ws.append(headers)
 
             # Format headers
@@ -136,22 +191,18 @@ class ExportManager:
                 cell.alignment = Alignment(horizontal="center", vertical="center")
                 cell.border = border
 
-            # Set column widths
-            ws.column_dimensions['A'].width = 15  # Image column
-            ws.column_dimensions['B'].width = 10  # ID
-            ws.column_dimensions['C'].width = 20  # Article Name
-            ws.column_dimensions['D'].width = 12  # Mould
-            ws.column_dimensions['E'].width = 10  # Size
-            ws.column_dimensions['F'].width = 12  # Gender
-            ws.column_dimensions['G'].width = 12  # Created By
-            ws.column_dimensions['H'].width = 15  # Created Date
-            ws.column_dimensions['I'].width = 12  # Sync Status
+            # Set column widths (ID, Article Name, Mould, Size, Gender, Created By, Created Date, Sync Status)
+            widths = [10, 20, 12, 10, 12, 12, 15, 12]
+            if any_images:
+                widths.insert(0, 15)  # Image column
+            for col, width in enumerate(widths, start=1):
+                ws.column_dimensions[get_column_letter(col)].width = width
 
             # Add data rows
+            pending_images = []
             for idx, article in enumerate(articles, start=2):
                 # Text data
                 row = [
-                    "",  # Image placeholder
                     article.get('id', '')[:8],
                     article.get('article_name', ''),
                     article.get('mould', ''),
@@ -161,6 +212,8 @@ class ExportManager:
                     article.get('created_at', '')[:10],
                     "Synced" if article.get('sync_status', 0) == 1 else "Pending"
                 ]
+                if any_images:
+                    row.insert(0, "")  # Image placeholder
                 ws.append(row)
 
                 # Format data cells
@@ -168,21 +221,38 @@ class ExportManager:
                     cell.border = border
                     cell.alignment = Alignment(horizontal="left", vertical="center")
 
-                # Try to embed image
-                image_path = article.get('image_path')
+                # Collect image to embed after all rows are written
+                image_path = article.get('image_path') if any_images else None
                 if image_path:
                     local_img = self._download_image(image_path)
                     if local_img:
-                        try:
-                            # Add image to cell
-                            xl_image = XLImage(local_img)
-                            xl_image.width = 80
-                            xl_image.height = 80
-                            ws.add_image(xl_image, f'A{idx}')
-                            ws.row_dimensions[idx].height = 90  # Adjust row height for image
-                        except Exception as e:
-                            self.logger.debug(f"Could not embed image: {e}")
-                            ws['A' + str(idx)] = "[Image Error]"
+                        pending_images.append((idx, local_img))
+
+            # Encode thumbnails in parallel so wb.save() only has to store them
+            if pending_images:
+                with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+                    thumbnails = list(executor.map(
+                        _make_excel_thumbnail, (local_img for _, local_img in pending_images)
+                    ))
+
+                image_rows = []
+                for (idx, local_img), thumbnail in zip(pending_images, thumbnails):
+                    try:
+                        if thumbnail is None:
+                            raise ValueError(f"unreadable image {local_img}")
+                        # Add image to cell
+                        xl_image = XLImage(thumbnail)
+                        xl_image.width = 80
+                        xl_image.height = 80
+                        ws.add_image(xl_image, f'A{idx}')
+                        image_rows.append(idx)
+                    except Exception as e:
+                        self.logger.debug(f"Could not embed image: {e}")
+                        ws['A' + str(idx)] = "[Image Error]"
+
+                # Adjust row heights for images in one pass
+                for idx in image_rows:
+                    ws.row_dimensions[idx].height = 90
 
             # Set header row height
             ws.row_dimensions[1].height = 25
@@ -207,6 +277,72 @@ class ExportManager:
             self.logger.error(f"Excel export failed: {e}")
             raise
 
+    def _export_articles_to_xlsxwriter(self, articles: List[Dict], output_path: str = None) -> str:
+        """
+        Export articles (without images) to Excel using xlsxwriter
+
+        constant_memory mode writes each row straight to the sheet XML, so only
+        the current row is held in memory.
+
+        Args:
+            articles: List of article dictionaries
+            output_path: Custom output path (optional)
+
+        Returns:
+            Path to created Excel file
+        """
+        try:
+            if output_path is None:
+                output_path = os.path.join(
+                    os.path.dirname(os.path.dirname(__file__)),
+                    f"exports",
+                    f"Articles_{self.timestamp}.xlsx"
+                )
+
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+            wb = xlsxwriter.Workbook(output_path, {'constant_memory': True, 'use_zip64': True})
+            ws = wb.add_worksheet("Articles")
+
+            # Define styles
+            header_format = wb.add_format({
+                'bold': True, 'font_color': '#FFFFFF', 'font_size': 12,
+                'bg_color': '#' + self.PRIMARY_HEX_EXCEL, 'border': 1,
+                'align': 'center', 'valign': 'vcenter'
+            })
+            cell_format = wb.add_format({'border': 1, 'align': 'left', 'valign': 'vcenter'})
+
+            # Set column widths
+            widths = [10, 20, 12, 10, 12, 12, 15, 12]
+            for col, width in enumerate(widths):
+                ws.set_column(col, col, width)
+
+            # Headers
+            headers = ["ID", "Article Name", "Mould", "Size", "Gender", "Created By", "Created Date", "Sync Status"]
+            ws.set_row(0, 25)
+            ws.write_row(0, 0, headers, header_format)
+
+            # Add data rows
+            for idx, article in enumerate(articles, start=1):
+                ws.write_row(idx, 0, [
+                    article.get('id', '')[:8],
+                    article.get('article_name', ''),
+                    article.get('mould', ''),
+                    article.get('size', ''),
+                    article.get('gender', ''),
+                    article.get('created_by', '')[:8],
+                    article.get('created_at', '')[:10],
+                    "Synced" if article.get('sync_status', 0) == 1 else "Pending"
+                ], cell_format)
+
+            wb.close()
+            self.logger.info(f"Articles exported to Excel: {output_path}")
+            return output_path
+
+        except Exception as e:
+            self.logger.error(f"Excel export failed: {e}")
+            raise
+
     def export_users_to_excel(self, users: List[Dict], output_path: str = None) -> str:
         """
         Export users to Excel file (without passwords)
@@ -320,6 +456,11 @@ class ExportManager:
 
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
+            if len(articles) > self.PDF_STREAM_THRESHOLD:
+                self._export_articles_to_pdf_canvas(articles, output_path)
+                self.logger.info(f"Articles exported to PDF with images: {output_path}")
+                return output_path
+
             # Create PDF
             doc = SimpleDocTemplate(
                 output_path,
@@ -336,7 +477,7 @@ class ExportManager:
                 'CustomTitle',
                 parent=styles['Heading1'],
                 fontSize=20,
-                textColor=colors.Color(*[c/255.0 for c in self.PRIMARY_RGB]),  # Convert RGB to 0-1 range
+                textColor=self.PRIMARY_COLOR,
                 spaceAfter=30,
                 alignment=TA_CENTER,
                 fontName='Helvetica-Bold'
@@ -351,6 +492,9 @@ class ExportManager:
                 spaceAfter=20
             )
 
+            # Skip image handling entirely when no article has an image
+            any_images = any(article.get('image_path') for article in articles)
+
             # Build content
             story = []
 
@@ -371,7 +515,7 @@ class ExportManager:
                 ))
 
                 # Try to embed image
-                image_path = article.get('image_path')
+                image_path = article.get('image_path') if any_images else None
                 if image_path:
                     local_img = self._download_image(image_path, max_width=200, max_height=200)
                     if local_img:
@@ -423,6 +567,102 @@ class ExportManager:
             self.logger.error(f"PDF export failed: {e}")
             raise
 
+    def _export_articles_to_pdf_canvas(self, articles: List[Dict], output_path: str):
+        """
+        Draw the articles PDF directly with the canvas API
+
+        Pages are emitted as soon as they are full, so memory stays bounded by
+        one page instead of growing with the number of articles.
+
+        Args:
+            articles: List of article dictionaries
+            output_path: Path of the PDF file to write
+        """
+        page_width, page_height = A4
+        left = 0.5*inch
+        top = page_height - 0.75*inch
+        bottom = 0.75*inch
+        line_height = 14
+        image_size = 2*inch
+        any_images = any(article.get('image_path') for article in articles)
+
+        c = canvas.Canvas(output_path, pagesize=A4)
+
+        # Title
+        y = top
+        c.setFillColor(self.PRIMARY_COLOR)
+        c.setFont('Helvetica-Bold', 20)
+        c.drawCentredString(page_width / 2, y - 20, "NEXUZY ARTICAL - Articles Export")
+        c.setFillColor(colors.grey)
+        c.setFont('Helvetica', 9)
+        c.drawRightString(
+            page_width - left, y - 50,
+            f"Generated on {datetime.now().strftime('%d-%m-%Y %H:%M:%S')}"
+        )
+        c.setFillColor(colors.black)
+        y -= 90
+
+        for article in articles:
+            local_img = None
+            image_path = article.get('image_path') if any_images else None
+            if image_path:
+                local_img = self._download_image(image_path, max_width=200, max_height=200)
+
+            # Start a new page if this article block does not fit
+            block_height = line_height * 8 + (image_size + 0.1*inch if local_img else 0)
+            if y - block_height < bottom:
+                c.showPage()
+                y = top
+
+            # Article header
+            c.setFont('Helvetica-Bold', 12)
+            c.drawString(left, y - 12, f"{article.get('article_name', 'N/A')} (ID: {article.get('id', '')[:8]})")
+            y -= 12 + 10
+
+            # Image
+            if local_img:
+                try:
+                    c.drawImage(local_img, left, y - image_size, width=image_size, height=image_size)
+                    y -= image_size + 0.1*inch
+                except Exception as e:
+                    self.logger.debug(f"Could not add image to PDF: {e}")
+                    c.setFont('Helvetica', 10)
+                    c.drawString(left, y - 10, "[Image not available]")
+                    y -= line_height
+
+            # Article details
+            details = [
+                ("Mould:", article.get('mould', 'N/A')),
+                ("Size:", article.get('size', 'N/A')),
+                ("Gender:", article.get('gender', 'N/A')),
+                ("Created:", article.get('created_at', 'N/A')[:10]),
+                ("Status:", 'Synced' if article.get('sync_status', 0) == 1 else 'Pending'),
+            ]
+            for label, value in details:
+                c.setFont('Helvetica-Bold', 10)
+                c.drawString(left, y - 10, label)
+                c.setFont('Helvetica', 10)
+                c.drawString(left + 55, y - 10, str(value))
+                y -= line_height
+
+            # Separator
+            y -= 0.1*inch
+            c.setStrokeColor(colors.lightgrey)
+            c.line(left, y, page_width - left, y)
+            y -= 0.1*inch
+
+        # Footer
+        if y - 0.3*inch - 8 < bottom:
+            c.showPage()
+            y = top
+        c.setFillColor(colors.grey)
+        c.setFont('Helvetica-Oblique', 8)
+        c.drawCentredString(
+            page_width / 2, y - 0.3*inch,
+            f"Total Articles: {len(articles)} | Export generated by NEXUZY ARTICAL"
+        )
+        c.save()
+
     def export_users_to_pdf(self, users: List[Dict], output_path: str = None) -> str:
         """
         Export users to PDF file
@@ -462,7 +702,7 @@ class ExportManager:
                 'CustomTitle',
                 parent=styles['Heading1'],
                 fontSize=20,
-                textColor=colors.Color(*[c/255.0 for c in self.PRIMARY_RGB]),  # Convert RGB to 0-1 range
+                textColor=self.PRIMARY_COLOR,
                 spaceAfter=30,
                 alignment=TA_CENTER,
                 fontName='Helvetica-Bold'
@@ -496,7 +736,7 @@ class ExportManager:
             )
 
             table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.Color(*[c/255.0 for c in self.PRIMARY_RGB])),
+                ('BACKGROUND', (0, 0), (-1, 0), self.PRIMARY_COLOR),
                 ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
                 ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
                 ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
@@ -505,7 +745,7 @@ class ExportManager:
                 ('ALIGN', (0, 1), (-1, -1), 'LEFT'),
                 ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
                 ('FONTSIZE', (0, 1), (-1, -1), 9),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor(self.SECONDARY_HEX_EXCEL)]),
+                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, self.SECONDARY_COLOR]),
                 ('GRID', (0, 0), (-1, -1), 1, colors.black),
                 ('TOPPADDING', (0, 1), (-1, -1), 8),
                 ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
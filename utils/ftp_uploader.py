@@ -8,22 +8,443 @@ PyInstaller-safe: Loads config from config.FTP_CONFIG_PATH
 """
 
 import ftplib
+import functools
 import os
 import sys
 import logging
 import json
+import mmap
+import queue
+import random
+import secrets
+import socket
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from io import BytesIO
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import List, Optional
+
+from PIL import Image, ImageOps
+
+try:
+    from ssl import SSLSocket
+except ImportError:
+    SSLSocket = ()
 
 logger = logging.getLogger(__name__)
 
+# Block size for data-connection reads/writes (ftplib defaults to 8 KiB)
+DEFAULT_TRANSFER_BLOCK_SIZE = 256 * 1024
+
+# Number of FTP connections kept open for concurrent transfers
+DEFAULT_POOL_SIZE = 4
+
+# Pooled connections idle longer than this are checked with NOOP before reuse
+IDLE_PROBE_SECONDS = 15
+
+# Idle pooled connections get a background NOOP this often so servers
+# (typical idle timeout 120-300 s) do not drop them between batches
+POOL_KEEPALIVE_SECONDS = 30
+
+# Errors worth retrying on a fresh connection (4xx replies, dropped or timed-out sockets);
+# error_perm (5xx, e.g. 530 bad login) is never retried
+_TRANSIENT_ERRORS = (ftplib.error_temp, EOFError, ConnectionError, socket.timeout)
+
+
+class FTPDialError(OSError):
+    """The FTP server could not be reached at all (not retried: waiting
+    a few seconds rarely helps and each attempt may block for the timeout)"""
+
+# Socket send/receive buffer size for FTP connections
+SOCKET_BUFFER_SIZE = 1024 * 1024
+
+# Idle seconds before TCP keepalive probes start on the control connection
+KEEPALIVE_IDLE_SECONDS = 60
+
+# Maximum number of files submitted to the worker threads at once by upload_images()
+DEFAULT_TRANSFER_BATCH_SIZE = 32
+
+# tls_mode values: plain FTP, TLS on control and data channels, or TLS on the
+# control channel only (credentials protected, image bytes sent unencrypted)
+TLS_MODES = ('none', 'explicit', 'control')
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer env var; warn and use default if it is not a number"""
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(f"⚠️ Invalid {name} '{value}', using {default}")
+        return default
+
+
+# JPEG/PNG uploads larger than this are re-encoded as WebP when that saves at
+# least 30%; 0 disables recompression
+RECOMPRESS_THRESHOLD = _env_int('FTP_RECOMPRESS_THRESHOLD', 200 * 1024)
+RECOMPRESS_MAX_RATIO = 0.7
+
+
+@functools.lru_cache(maxsize=1)
+def _read_ftp_config(config_path: str) -> Optional[MappingProxyType]:
+    """Parse ftp_config.json once; returns a read-only mapping, or None if missing"""
+    if not os.path.exists(config_path):
+        return None
+    with open(config_path, 'r', encoding='utf-8') as f:
+        return MappingProxyType(json.load(f))
+
+
+def reload_config():
+    """Forget the cached ftp_config.json so the next FTPUploader re-reads it"""
+    _read_ftp_config.cache_clear()
+
+
+def _retry(fn, *, max_retries: int = 3, base: float = 1.0, cap: float = 30.0, jitter: float = 0.5):
+    """Call fn(), retrying transient FTP errors with exponential backoff and jitter
+
+    Waits min(cap, base * 2**attempt * (1 + uniform(0, jitter))) seconds
+    between attempts; any other exception propagates immediately.
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return fn()
+        except _TRANSIENT_ERRORS as e:
+            if attempt == max_retries:
+                raise
+            delay = min(cap, base * 2 ** attempt * (1 + random.uniform(0, jitter)))
+            logger.warning(f"⚠️ Transient FTP error ({e}), retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+
+class FTPCircuitOpenError(ConnectionError):
+    """Raised instead of dialing while the FTP server is considered down"""
+
+
+class _Breaker:
+    """Circuit breaker that fails fast after repeated FTP connection failures
+
+    After `threshold` consecutive failed operations the circuit opens and
+    calls are rejected for `reset_timeout` seconds; then one probe call is
+    let through (half-open) and its outcome closes or re-opens the circuit.
+    Permission errors (5xx) mean the server is up, so they do not count.
+    """
+
+    def __init__(self, threshold: int = 5, reset_timeout: float = 30.0):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.state = 'closed'
+        self.failure_count = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Return True if a call may go ahead now"""
+        with self._lock:
+            if self.state == 'closed':
+                return True
+            if self.state == 'open' and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = 'half_open'
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = 'closed'
+            self.failure_count = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failure_count += 1
+            if self.state == 'half_open' or self.failure_count >= self.threshold:
+                if self.state != 'open':
+                    logger.warning(f"⚠️ FTP server unreachable, pausing FTP calls for {self.reset_timeout:.0f}s")
+                self.state = 'open'
+                self.opened_at = time.monotonic()
+
+    def call(self, fn, *args):
+        """Run fn(*args) through the breaker
+
+        Raises:
+            FTPCircuitOpenError: If the circuit is open
+        """
+        if not self.allow():
+            raise FTPCircuitOpenError("FTP server unavailable, skipping call (circuit open)")
+        try:
+            result = fn(*args)
+        except ftplib.error_perm:
+            self.record_success()
+            raise
+        except ftplib.all_errors:
+            self.record_failure()
+            raise
+        except BaseException:
+            # Not a connection problem; free the half-open probe slot
+            with self._lock:
+                if self.state == 'half_open':
+                    self.state = 'open'
+            raise
+        self.record_success()
+        return result
+
+
+def _maybe_recompress(local_path: str, size: int) -> Optional[BytesIO]:
+    """Re-encode a large JPEG/PNG of the given size as WebP (quality 80) in memory
+
+    Returns:
+        Buffer holding the WebP image, or None to upload the original file
+        (small, animated or unsupported images, errors, or too little saving)
+    """
+    if not RECOMPRESS_THRESHOLD or size <= RECOMPRESS_THRESHOLD:
+        return None
+    try:
+        with Image.open(local_path) as img:
+            if img.format not in ('JPEG', 'PNG') or getattr(img, 'is_animated', False):
+                return None
+            img = ImageOps.exif_transpose(img)  # WebP output drops the EXIF orientation tag
+            if img.mode not in ('RGB', 'RGBA'):
+                img = img.convert('RGBA' if img.mode in ('P', 'LA', 'PA') else 'RGB')
+            buf = BytesIO()
+            img.save(buf, 'WEBP', quality=80, method=4)
+    except Exception as e:
+        logger.debug(f"Recompression skipped for {local_path}: {e}")
+        return None
+
+    if buf.tell() > size * RECOMPRESS_MAX_RATIO:
+        return None
+    logger.info(f"🗜️ Recompressed {os.path.basename(local_path)} to WebP: {size} -> {buf.tell()} bytes")
+    buf.seek(0)
+    return buf
+
+
+@contextmanager
+def _map_file(file):
+    """Memory-map an open file read-only; yields None if it cannot be mapped (e.g. empty)"""
+    try:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError):
+        mapped = None
+    try:
+        yield mapped
+    finally:
+        if mapped is not None:
+            mapped.close()
+
+
+def _ensure_cwd(ftp: ftplib.FTP, path: str):
+    """Change to path unless the connection is already there
+
+    The last directory is remembered on the connection itself, saving one
+    control-channel round-trip per transfer when it does not change.
+    """
+    if getattr(ftp, '_cwd_cache', None) == path:
+        return
+    try:
+        ftp.cwd(path)
+    except ftplib.error_perm:
+        ftp._cwd_cache = None
+        raise
+    ftp._cwd_cache = path
+
+
+def _make_remote_dirs(ftp: ftplib.FTP, path: str):
+    """Create path and any missing parents with one MKD per component
+
+    A 550 reply is taken to mean the component already exists; if it was
+    really a permission problem the final CWD reports it.
+    """
+    current = '/' if path.startswith('/') else ''
+    for part in filter(None, path.split('/')):
+        current = f"{current.rstrip('/')}/{part}" if current else part
+        try:
+            ftp.mkd(current)
+        except ftplib.error_perm as e:
+            if not str(e).startswith('550'):
+                raise
+
+
+def _tune_socket(sock: socket.socket, keepalive: bool = False):
+    """Enlarge socket buffers and optionally enable TCP keepalive (best effort)"""
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+        if keepalive:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if hasattr(socket, 'TCP_KEEPIDLE'):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, KEEPALIVE_IDLE_SECONDS)
+    except OSError as e:
+        logger.debug(f"Could not tune FTP socket: {e}")
+
+
+class _TuningMixin:
+    """Keepalive on the control socket and large buffers on all sockets
+
+    Keepalive stops NAT/firewalls from silently dropping idle pooled
+    connections; the larger buffers let a single transfer fill high
+    bandwidth-delay links.
+    """
+
+    def connect(self, *args, **kwargs):
+        welcome = super().connect(*args, **kwargs)
+        _tune_socket(self.sock, keepalive=True)
+        return welcome
+
+    def ntransfercmd(self, cmd, rest=None):
+        conn, size = super().ntransfercmd(cmd, rest)
+        _tune_socket(conn)
+        return conn, size
+
+
+class _TunedFTP(_TuningMixin, ftplib.FTP):
+    """Plain FTP connection with tuned sockets"""
+
+
+class _TunedFTP_TLS(_TuningMixin, ftplib.FTP_TLS):
+    """Explicit FTPS (AUTH TLS) connection with tuned sockets"""
+
+
+class FTPConnectionPool:
+    """Thread-safe pool of logged-in FTP connections
+
+    Connections are opened lazily through ``factory`` (up to ``size`` at a
+    time) and handed back to the pool after each transfer, so batches reuse
+    warm connections instead of repeating connect + LOGIN + CWD per file.
+    """
+
+    def __init__(self, factory, size: int = DEFAULT_POOL_SIZE):
+        """
+        Initialize connection pool.
+
+        Args:
+            factory: Callable returning a new logged-in ftplib.FTP (raises on failure)
+            size: Maximum number of connections open at the same time
+        """
+        self._factory = factory
+        self.size = max(1, size)
+        self._idle = queue.Queue()
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._keepalive_timer = None
+        self._keepalive_lock = threading.Lock()
+
+    @contextmanager
+    def acquire(self):
+        """Borrow a connection for the duration of a ``with`` block
+
+        Connections that fail with a socket/protocol error are discarded
+        instead of being returned, so the next caller dials a fresh one.
+        """
+        self._slots.acquire()
+        ftp = None
+        try:
+            ftp = self._checkout()
+            yield ftp
+        except ftplib.error_perm:
+            # Server answered normally, connection is still usable
+            raise
+        except ftplib.all_errors:
+            self._close(ftp)
+            ftp = None
+            raise
+        finally:
+            if ftp is not None:
+                ftp._last_used = time.monotonic()
+                self._idle.put(ftp)
+                self._schedule_keepalive()
+            self._slots.release()
+
+    def _checkout(self) -> ftplib.FTP:
+        """Take an idle connection that is still alive, or dial a new one"""
+        while True:
+            try:
+                ftp = self._idle.get_nowait()
+            except queue.Empty:
+                return self._factory()
+
+            # Servers drop idle sessions; probe before handing out an old one
+            if time.monotonic() - getattr(ftp, '_last_used', 0) < IDLE_PROBE_SECONDS:
+                return ftp
+            try:
+                ftp.voidcmd('NOOP')
+                return ftp
+            except ftplib.all_errors:
+                logger.info("Pooled FTP connection went stale, reconnecting")
+                self._close(ftp)
+
+    def _schedule_keepalive(self):
+        """Start the background keepalive timer unless it is already pending"""
+        with self._keepalive_lock:
+            if self._keepalive_timer is not None:
+                return
+            timer = threading.Timer(POOL_KEEPALIVE_SECONDS, self._keepalive)
+            timer.daemon = True
+            self._keepalive_timer = timer
+            timer.start()
+
+    def _keepalive(self):
+        """Send NOOP on idle connections, dropping the ones that died"""
+        with self._keepalive_lock:
+            self._keepalive_timer = None
+
+        # Check each connection out through a free slot so the pool never
+        # exceeds its size while a connection is being probed
+        for _ in range(self._idle.qsize()):
+            if not self._slots.acquire(blocking=False):
+                break
+            try:
+                ftp = self._idle.get_nowait()
+            except queue.Empty:
+                self._slots.release()
+                break
+            try:
+                if time.monotonic() - getattr(ftp, '_last_used', 0) >= POOL_KEEPALIVE_SECONDS:
+                    ftp.voidcmd('NOOP')
+                    ftp._last_used = time.monotonic()
+                self._idle.put(ftp)
+            except ftplib.all_errors:
+                logger.info("Idle pooled FTP connection dropped by server")
+                self._close(ftp)
+            finally:
+                self._slots.release()
+
+        if not self._idle.empty():
+            self._schedule_keepalive()
+
+    def close_all(self):
+        """Close all idle connections"""
+        with self._keepalive_lock:
+            if self._keepalive_timer is not None:
+                self._keepalive_timer.cancel()
+                self._keepalive_timer = None
+        while True:
+            try:
+                ftp = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._close(ftp)
+
+    @staticmethod
+    def _close(ftp: Optional[ftplib.FTP]):
+        if ftp is None or ftp.sock is None:
+            return
+        try:
+            ftp.quit()
+        except ftplib.all_errors:
+            ftp.close()
+
 
 class FTPUploader:
     """Handles FTP file uploads for article images"""
 
     def __init__(self, host: str = None, port: int = 21, username: str = None, password: str = None, 
                  remote_dir: str = '/public_html/articles/images', 
-                 base_url: str = 'https://yourdomain.com/articles/images'):
+                 base_url: str = 'https://yourdomain.com/articles/images',
+                 transfer_block_size: int = None, pool_size: int = None):
         """
         Initialize FTP uploader.
         
@@ -34,6 +455,13 @@ class FTPUploader:
             password: FTP password
             remote_dir: Remote directory path on FTP server
             base_url: Public base URL (not used for blocked servers)
+            transfer_block_size: Bytes per data-connection read/write
+                (default: FTP_BLOCKSIZE env var, then config, then 256 KiB)
+            pool_size: Maximum number of pooled FTP connections (default 4)
+
+        The tls_mode config key (or FTP_TLS_MODE env var) selects 'none',
+        'explicit' (AUTH TLS with encrypted data) or 'control' (AUTH TLS,
+        plaintext data channel).
         """
         # Try to load from ftp_config.json first
         self._load_config()
@@ -45,8 +473,20 @@ class FTPUploader:
         self.password = password or self.password or os.getenv('FTP_PASS')
         self.remote_dir = remote_dir if remote_dir != '/public_html/articles/images' else self.remote_dir
         self.base_url = base_url.rstrip('/') if base_url != 'https://yourdomain.com/articles/images' else self.base_url.rstrip('/')
+        self.transfer_block_size = (transfer_block_size or _env_int('FTP_BLOCKSIZE', 0)
+                                    or self.transfer_block_size)
+        self.pool_size = pool_size or self.pool_size
         self.connected = False
         self.ftp = None
+        self.tls_mode = (os.getenv('FTP_TLS_MODE') or self.tls_mode or 'none').lower()
+        if self.tls_mode not in TLS_MODES:
+            logger.warning(f"⚠️ Unknown FTP tls_mode '{self.tls_mode}', using plain FTP")
+            self.tls_mode = 'none'
+        self._host_addr = None
+        self._remote_dir_ready = False
+        self._buffers = threading.local()
+        self._breaker = _Breaker()
+        self._pool = FTPConnectionPool(self._open_connection, self.pool_size)
 
     def _load_config(self):
         """Load FTP configuration from ftp_config.json - PyInstaller safe"""
@@ -66,21 +506,23 @@ class FTPUploader:
             
             logger.info(f"Loading FTP config from: {config_path}")
             
-            if os.path.exists(config_path):
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                    
-                    # Support both 'host' and 'ftp_host' formats
-                    self.host = config.get('host') or config.get('ftp_host')
-                    self.port = config.get('port', 21)
-                    self.username = config.get('username') or config.get('ftp_user')
-                    self.password = config.get('password') or config.get('ftp_pass')
-                    self.remote_dir = config.get('remote_dir') or config.get('ftp_remote_dir', '/public_html/articles/images')
-                    self.base_url = (config.get('public_url_base') or config.get('ftp_base_url', 'https://yourdomain.com/articles/images')).rstrip('/')
-                    
-                    logger.info(f"✅ FTP config loaded: {self.host}:{self.port}")
-                    logger.info(f"   Remote directory: {self.remote_dir}")
-                    return
+            config = _read_ftp_config(config_path)
+            if config is not None:
+                # Support both 'host' and 'ftp_host' formats
+                self.host = config.get('host') or config.get('ftp_host')
+                self.port = config.get('port', 21)
+                self.username = config.get('username') or config.get('ftp_user')
+                self.password = config.get('password') or config.get('ftp_pass')
+                self.remote_dir = config.get('remote_dir') or config.get('ftp_remote_dir', '/public_html/articles/images')
+                self.base_url = (config.get('public_url_base') or config.get('ftp_base_url', 'https://yourdomain.com/articles/images')).rstrip('/')
+                self.transfer_block_size = int(config.get('transfer_block_size', DEFAULT_TRANSFER_BLOCK_SIZE))
+                self.pool_size = int(config.get('pool_size', DEFAULT_POOL_SIZE))
+                self.transfer_batch_size = int(config.get('transfer_batch_size', DEFAULT_TRANSFER_BATCH_SIZE))
+                self.tls_mode = config.get('tls_mode', 'none')
+
+                logger.info(f"✅ FTP config loaded: {self.host}:{self.port}")
+                logger.info(f"   Remote directory: {self.remote_dir}")
+                return
             else:
                 logger.warning(f"FTP config file not found: {config_path}")
         except Exception as e:
@@ -93,62 +535,106 @@ class FTPUploader:
         self.password = None
         self.remote_dir = '/public_html/articles/images'
         self.base_url = 'https://yourdomain.com/articles/images'
+        self.transfer_block_size = DEFAULT_TRANSFER_BLOCK_SIZE
+        self.pool_size = DEFAULT_POOL_SIZE
+        self.transfer_batch_size = DEFAULT_TRANSFER_BATCH_SIZE
+        self.tls_mode = 'none'
 
-    def connect(self) -> bool:
-        """Establish FTP connection"""
+    def _open_connection(self) -> ftplib.FTP:
+        """Open a new logged-in FTP connection positioned in remote_dir
+
+        Raises:
+            ftplib.error_perm: If FTP credentials are not configured
+            ftplib.all_errors: If connecting, login or directory setup fails
+        """
+        if not (self.host and self.username and self.password):
+            logger.warning("❌ FTP credentials not configured. Please check ftp_config.json")
+            logger.warning(f"   Host: {self.host}")
+            logger.warning(f"   User: {self.username}")
+            logger.warning(f"   Pass: {'***' if self.password else 'None'}")
+            raise ftplib.error_perm("530 FTP credentials not configured")
+
+        logger.info(f"🔗 Connecting to FTP: {self.username}@{self.host}:{self.port}")
+
+        # Connect with port support
+        if self.tls_mode == 'none':
+            ftp = _TunedFTP(timeout=30)
+            host = self._resolve_host()
+        else:
+            # TLS checks the certificate against the hostname, so dial by name
+            ftp = _TunedFTP_TLS(timeout=30)
+            host = self.host
         try:
-            if not all([self.host, self.username, self.password]):
-                logger.warning("❌ FTP credentials not configured. Please check ftp_config.json")
-                logger.warning(f"   Host: {self.host}")
-                logger.warning(f"   User: {self.username}")
-                logger.warning(f"   Pass: {'***' if self.password else 'None'}")
-                return False
+            try:
+                ftp.connect(host, self.port or 21)
+            except OSError as e:
+                raise FTPDialError(f"Cannot reach FTP server {self.host}:{self.port}: {e}") from e
+            ftp.login(self.username, self.password)  # FTP_TLS sends AUTH TLS first
+            if self.tls_mode == 'explicit':
+                ftp.prot_p()
 
-            logger.info(f"🔗 Connecting to FTP: {self.username}@{self.host}:{self.port}")
-            
-            # Connect with port support
-            if self.port and self.port != 21:
-                self.ftp = ftplib.FTP(timeout=30)
-                self.ftp.connect(self.host, self.port)
-                self.ftp.login(self.username, self.password)
-            else:
-                self.ftp = ftplib.FTP(self.host, timeout=30)
-                self.ftp.login(self.username, self.password)
-            
-            self.ftp.set_pasv(True)  # Use passive mode
-            
-            current_dir = self.ftp.pwd()
+            ftp.set_pasv(True)  # Use passive mode
+
+            # remote_dir was already verified/created by an earlier connection:
+            # go straight there without the PWD/listing diagnostics
+            if self._remote_dir_ready:
+                _ensure_cwd(ftp, self.remote_dir)
+                return ftp
+
+            current_dir = ftp.pwd()
             logger.info(f"✅ FTP login successful! Current directory: {current_dir}")
-            
+
             # Navigate to remote directory
             try:
                 logger.info(f"📁 Attempting to change to: {self.remote_dir}")
-                self.ftp.cwd(self.remote_dir)
+                _ensure_cwd(ftp, self.remote_dir)
                 logger.info(f"✅ Successfully changed to directory: {self.remote_dir}")
-                logger.info(f"   Current directory: {self.ftp.pwd()}")
+                logger.info(f"   Current directory: {ftp.pwd()}")
             except ftplib.error_perm as e:
                 logger.error(f"❌ Directory {self.remote_dir} not accessible: {e}")
-                
+
                 # List current directory contents for debugging
                 try:
                     logger.info("Available directories:")
-                    dirs = self.ftp.nlst()
+                    dirs = ftp.nlst()
                     for d in dirs[:10]:  # Show first 10
                         logger.info(f"  - {d}")
-                except:
+                except ftplib.all_errors:
+                    # Diagnostics only (e.g. '450 No files found' on an empty dir)
                     pass
-                
+
                 # Try to create the directory
                 try:
                     logger.info(f"🔨 Attempting to create directory: {self.remote_dir}")
-                    self.ftp.mkd(self.remote_dir)
-                    self.ftp.cwd(self.remote_dir)
+                    _make_remote_dirs(ftp, self.remote_dir)
+                    _ensure_cwd(ftp, self.remote_dir)
                     logger.info(f"✅ Created and changed to directory: {self.remote_dir}")
-                except Exception as mkdir_error:
+                except ftplib.error_perm as mkdir_error:
                     logger.error(f"❌ Cannot create or access directory: {mkdir_error}")
                     logger.error(f"   Please manually create '{self.remote_dir}' on your FTP server")
-                    return False
-            
+                    raise
+        except BaseException:
+            ftp.close()
+            # The server may have moved; look the name up again next time
+            self._host_addr = None
+            raise
+
+        self._remote_dir_ready = True
+        return ftp
+
+    def _resolve_host(self) -> str:
+        """Resolve host once so pooled connections skip the DNS lookup"""
+        if self._host_addr is None:
+            try:
+                self._host_addr = socket.gethostbyname(self.host)
+            except OSError:
+                return self.host
+        return self._host_addr
+
+    def connect(self) -> bool:
+        """Establish FTP connection"""
+        try:
+            self.ftp = self._breaker.call(_retry, self._open_connection)
             self.connected = True
             logger.info(f"✅ FTP connected successfully to {self.host}")
             return True
@@ -163,83 +649,242 @@ class FTPUploader:
             logger.error(f"   Host: {self.host}:{self.port}, User: {self.username}")
             self.connected = False
             return False
-        except Exception as e:
-            logger.error(f"❌ Unexpected FTP error: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
-            self.connected = False
-            return False
 
     def disconnect(self):
-        """Close FTP connection"""
+        """Close FTP connection and any pooled connections"""
+        self._pool.close_all()
         if self.ftp:
-            try:
-                self.ftp.quit()
-            except:
-                try:
-                    self.ftp.close()
-                except:
-                    pass
+            FTPConnectionPool._close(self.ftp)
+            self.ftp = None
             self.connected = False
             logger.info("FTP disconnected")
 
-    def upload_image(self, local_path: str, remote_filename: Optional[str] = None) -> Optional[str]:
+    def upload_image(self, local_path: str, remote_filename: Optional[str] = None,
+                     skip_if_exists: bool = False, max_retries: int = 3) -> Optional[str]:
         """
         Upload image file to FTP server.
         
         Args:
             local_path: Path to local image file
             remote_filename: Optional custom filename (generated if not provided)
+            skip_if_exists: Skip the transfer if remote_filename already exists
+                on the server with the same size as the local file
+            max_retries: Retries after a dropped connection or 4xx reply
+                (use 0-1 when the caller is waiting, e.g. on the UI thread)
             
         Returns:
             FTP path (e.g., /nexuzy/article_20260121_123456.jpg), or None if upload failed
         """
         try:
-            if not os.path.exists(local_path):
+            try:
+                size = os.stat(local_path).st_size
+            except FileNotFoundError:
                 logger.error(f"❌ Local file not found: {local_path}")
                 return None
 
-            # Connect if not already connected
-            if not self.connected:
-                if not self.connect():
-                    logger.error("❌ Cannot upload: FTP connection failed")
-                    return None
-
-            # Generate unique filename if not provided
+            # Generate unique filename if not provided; only then is the
+            # format ours to choose, so only then try a smaller WebP
             if not remote_filename:
-                file_ext = Path(local_path).suffix.lower()
-                from datetime import datetime
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                import random
-                import string
-                random_str = ''.join(random.choices(string.ascii_lowercase + string.digits, k=6))
-                remote_filename = f"article_{timestamp}_{random_str}{file_ext}"
+                webp = None if skip_if_exists else _maybe_recompress(local_path, size)
+                if webp is not None:
+                    remote_filename = self._make_remote_filename(str(Path(local_path).with_suffix('.webp')))
+                    webp_size = webp.getbuffer().nbytes
+                    return self._breaker.call(lambda: _retry(
+                        lambda: self._upload_once(webp, None, remote_filename, webp_size, False),
+                        max_retries=max_retries))
+                remote_filename = self._make_remote_filename(local_path)
 
+            # Open and map the file once; each retry resends the same mapping
+            with open(local_path, 'rb', buffering=0) as file, _map_file(file) as mapped:
+                return self._breaker.call(lambda: _retry(
+                    lambda: self._upload_once(file, mapped, remote_filename, size, skip_if_exists),
+                    max_retries=max_retries))
+
+        except ftplib.error_perm as e:
+            logger.error(f"❌ FTP permission error during upload: {e}")
+            return None
+        except FTPCircuitOpenError as e:
+            logger.error(f"❌ FTP upload skipped: {e}")
+            return None
+        except ftplib.all_errors as e:
+            logger.error(f"❌ FTP upload failed: {e}")
+            logger.error(traceback.format_exc())
+            return None
+
+    @staticmethod
+    def _remote_size(ftp: ftplib.FTP, remote_filename: str) -> Optional[int]:
+        """Return the size of a remote file, or None if it does not exist"""
+        try:
+            ftp.voidcmd('TYPE I')  # SIZE is only reliable in binary mode
+            return ftp.size(remote_filename)
+        except ftplib.error_perm:
+            return None
+
+    @staticmethod
+    def _make_remote_filename(local_path: str) -> str:
+        """Generate a unique remote filename keeping the local extension"""
+        file_ext = Path(local_path).suffix.lower()
+        return f"article_{datetime.now():%Y%m%d_%H%M%S}_{secrets.token_hex(4)}{file_ext}"
+
+    def _upload_once(self, file, mapped: Optional[mmap.mmap], remote_filename: str, size: int,
+                     skip_if_exists: bool) -> Optional[str]:
+        """Upload an open local file over one pooled connection (see upload_image)"""
+        with self._pool.acquire() as ftp:
             # Ensure we're in the correct directory
             try:
-                self.ftp.cwd(self.remote_dir)
-            except:
+                _ensure_cwd(ftp, self.remote_dir)
+            except ftplib.error_perm:
                 logger.error(f"❌ Cannot access remote directory: {self.remote_dir}")
                 return None
 
+            if skip_if_exists and self._remote_size(ftp, remote_filename) == size:
+                ftp_path = f"{self.remote_dir}/{remote_filename}"
+                logger.info(f"⏭️ Already on FTP with same size, skipping upload: {ftp_path}")
+                return ftp_path
+
             # Upload file in binary mode
-            logger.info(f"📤 Uploading {os.path.basename(local_path)} as {remote_filename}")
-            with open(local_path, 'rb') as file:
-                self.ftp.storbinary(f'STOR {remote_filename}', file)
+            logger.info(f"📤 Uploading {os.path.basename(getattr(file, 'name', remote_filename))} "
+                        f"({size} bytes) as {remote_filename}")
+            self._fast_stor(ftp, remote_filename, file, mapped)
 
-            # Return FTP path (not URL)
-            ftp_path = f"{self.remote_dir}/{remote_filename}"
-            logger.info(f"✅ Image uploaded successfully to FTP: {ftp_path}")
-            return ftp_path
+        # Return FTP path (not URL)
+        ftp_path = f"{self.remote_dir}/{remote_filename}"
+        logger.info(f"✅ Image uploaded successfully to FTP: {ftp_path}")
+        return ftp_path
 
-        except ftplib.error_perm as e:
-            logger.error(f"❌ FTP permission error during upload: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"❌ FTP upload failed: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
-            return None
+    def upload_images(self, local_paths: List[str], max_workers: int = None) -> List[Optional[str]]:
+        """
+        Upload several image files in parallel over pooled connections.
+
+        Args:
+            local_paths: Paths to local image files
+            max_workers: Number of concurrent uploads (default: pool size)
+
+        Returns:
+            FTP paths in the same order as local_paths (None for failed uploads)
+        """
+        max_workers = min(max_workers or self.pool_size, self.pool_size)
+        batch_size = max(1, self.transfer_batch_size)
+        results = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for start in range(0, len(local_paths), batch_size):
+                batch = local_paths[start:start + batch_size]
+                results.extend(executor.map(self.upload_image, batch))
+        return results
+
+    def upload_images_serial(self, local_paths: List[str]) -> List[Optional[str]]:
+        """
+        Upload several image files one after another over a single connection.
+
+        CWD and TYPE are sent once for the whole batch; each file then costs
+        only its PASV + STOR exchange. The next PASV is deliberately not sent
+        before the previous transfer's reply: servers may tear down an
+        in-flight data channel when a new passive port is requested.
+
+        Args:
+            local_paths: Paths to local image files
+
+        Returns:
+            FTP paths in the same order as local_paths (None for failed uploads)
+        """
+        results: List[Optional[str]] = [None] * len(local_paths)
+        next_idx = 0
+
+        def upload_batch():
+            nonlocal next_idx
+            with self._pool.acquire() as ftp:
+                _ensure_cwd(ftp, self.remote_dir)
+                ftp.voidcmd('TYPE I')
+
+                for idx, local_path in enumerate(local_paths):
+                    next_idx = idx
+                    try:
+                        file = open(local_path, 'rb', buffering=0)
+                    except OSError:
+                        logger.error(f"❌ Local file not found: {local_path}")
+                        continue
+
+                    remote_filename = self._make_remote_filename(local_path)
+                    logger.info(f"📤 Uploading {os.path.basename(local_path)} as {remote_filename}")
+                    try:
+                        with file, ftp.transfercmd(f'STOR {remote_filename}') as conn:
+                            self._send_file(conn, file)
+                        ftp.voidresp()
+                    except ftplib.error_perm as e:
+                        # Rejected by the server (e.g. 550): the control
+                        # connection is still usable for the next file
+                        logger.error(f"❌ FTP upload failed for {local_path}: {e}")
+                        continue
+                    results[idx] = f"{self.remote_dir}/{remote_filename}"
+                next_idx = len(local_paths)
+
+        try:
+            self._breaker.call(upload_batch)
+        except ftplib.all_errors as e:
+            skipped = [os.path.basename(p) for p in local_paths[next_idx:]]
+            logger.error(f"❌ FTP batch upload failed: {e}")
+            logger.error(f"   Not uploaded: {', '.join(skipped)}")
+
+        logger.info(f"✅ Uploaded {sum(1 for r in results if r)}/{len(local_paths)} images to FTP")
+        return results
+
+    def _fast_stor(self, ftp: ftplib.FTP, remote_filename: str, file, mapped: Optional[mmap.mmap] = None):
+        """Upload a file with STOR, letting the kernel copy the bytes.
+
+        ftplib's storbinary() reads the file into Python and writes it to the
+        socket chunk by chunk. Opening the data connection ourselves lets
+        socket.sendfile() hand the copy to sendfile(2) where available.
+        Elsewhere (e.g. Windows) the bytes are sent from the file's memory
+        mapping instead of being read into new bytes objects per block.
+        """
+        ftp.voidcmd('TYPE I')
+        with ftp.transfercmd(f'STOR {remote_filename}') as conn:
+            self._send_file(conn, file, mapped)
+        ftp.voidresp()
+
+    def _send_file(self, conn, file, mapped: Optional[mmap.mmap] = None):
+        """Copy an open local file to a data connection
+
+        Plain sockets use os.sendfile() (through socket.sendfile(), which
+        also handles partial writes) so the kernel copies page cache straight
+        to the socket. TLS-wrapped sockets must encrypt in user space, and
+        platforms without sendfile have no kernel path; both send straight
+        from the file's memory mapping when there is one, or stream through
+        a reusable buffer otherwise. In-memory (recompressed) images are sent
+        straight from their buffer.
+
+        Always sends the whole file from offset 0, so it can be called again
+        on the same open file to retry an upload.
+        """
+        if isinstance(file, BytesIO):
+            conn.sendall(file.getbuffer())
+        elif hasattr(os, 'sendfile') and not isinstance(conn, SSLSocket):
+            conn.sendfile(file, 0)
+        elif mapped is not None:
+            conn.sendall(mapped)
+        else:
+            file.seek(0)
+            self._send_buffered(conn, file)
+        if isinstance(conn, SSLSocket):
+            # Close the TLS session cleanly, or the server may drop the tail
+            conn.unwrap()
+
+    def _send_buffered(self, conn, file):
+        """Stream file to conn with readinto() over a reusable buffer"""
+        view = self._transfer_buffer()
+        while True:
+            n = file.readinto(view)
+            if not n:
+                break
+            conn.sendall(view[:n])
+
+    def _transfer_buffer(self) -> memoryview:
+        """Return this thread's transfer buffer, allocated once per thread"""
+        view = getattr(self._buffers, 'view', None)
+        if view is None or len(view) != self.transfer_block_size:
+            view = memoryview(bytearray(self.transfer_block_size))
+            self._buffers.view = view
+        return view
 
     def download_image(self, ftp_path: str, local_path: str) -> bool:
         """Download image from FTP server with authentication
@@ -253,13 +898,6 @@ class FTPUploader:
         """
         try:
             logger.info(f"📥 Attempting to download: {ftp_path}")
-            
-            # Connect if not already connected
-            if not self.connected:
-                logger.info("   Connecting to FTP server...")
-                if not self.connect():
-                    logger.error("❌ Cannot download: FTP connection failed")
-                    return False
 
             # Extract directory and filename from path
             directory = os.path.dirname(ftp_path)
@@ -268,19 +906,37 @@ class FTPUploader:
             logger.info(f"   Directory: {directory}")
             logger.info(f"   Filename: {filename}")
 
-            # Change to directory
-            if directory:
-                try:
-                    self.ftp.cwd(directory)
-                    logger.info(f"   Changed to directory: {directory}")
-                except Exception as e:
-                    logger.error(f"❌ Cannot access directory {directory}: {e}")
-                    return False
+            def download_once() -> bool:
+                with self._pool.acquire() as ftp:
+                    # Change to directory
+                    if directory:
+                        try:
+                            _ensure_cwd(ftp, directory)
+                            logger.info(f"   Changed to directory: {directory}")
+                        except ftplib.error_perm as e:
+                            logger.error(f"❌ Cannot access directory {directory}: {e}")
+                            return False
+
+                    # Download to a .part file and rename when complete, so an
+                    # interrupted transfer never leaves a truncated local_path
+                    logger.info(f"   Downloading to: {local_path}")
+                    part_path = f"{local_path}.part"
+                    try:
+                        with open(part_path, 'wb', buffering=self.transfer_block_size) as file:
+                            received, expected = self._fast_retr(ftp, filename, file)
+                        if expected is not None and received != expected:
+                            logger.error(f"❌ Incomplete download: got {received} of {expected} bytes")
+                            os.remove(part_path)
+                            return False
+                        os.replace(part_path, local_path)
+                    except BaseException:
+                        if os.path.exists(part_path):
+                            os.remove(part_path)
+                        raise
+                return True
 
-            # Download file
-            logger.info(f"   Downloading to: {local_path}")
-            with open(local_path, 'wb') as file:
-                self.ftp.retrbinary(f'RETR {filename}', file.write)
+            if not self._breaker.call(download_once):
+                return False
 
             logger.info(f"✅ Downloaded successfully: {local_path}")
             return True
@@ -289,25 +945,51 @@ class FTPUploader:
             logger.error(f"❌ FTP permission error during download: {e}")
             logger.error(f"   File may not exist: {ftp_path}")
             return False
+        except FTPCircuitOpenError as e:
+            logger.error(f"❌ FTP download skipped: {e}")
+            return False
         except Exception as e:
             logger.error(f"❌ FTP download failed: {e}")
-            import traceback
             logger.error(traceback.format_exc())
             return False
 
+    def _fast_retr(self, ftp: ftplib.FTP, filename: str, file) -> tuple:
+        """RETR filename into an open file
+
+        Like retrbinary(), but also returns the size announced in the
+        server's 150 reply so the caller can detect a short transfer.
+
+        Returns:
+            (bytes received, expected size or None if not announced)
+        """
+        ftp.voidcmd('TYPE I')
+        received = 0
+        conn, expected = ftp.ntransfercmd(f'RETR {filename}')
+        with conn:
+            while True:
+                data = conn.recv(self.transfer_block_size)
+                if not data:
+                    break
+                file.write(data)
+                received += len(data)
+            if isinstance(conn, SSLSocket):
+                conn.unwrap()
+        ftp.voidresp()
+        return received, expected
+
     def delete_image(self, filename: str) -> bool:
         """Delete image from FTP server"""
-        try:
-            if not self.connected:
-                if not self.connect():
-                    return False
+        def delete_once():
+            with self._pool.acquire() as ftp:
+                _ensure_cwd(ftp, self.remote_dir)
+                ftp.delete(filename)
 
-            self.ftp.cwd(self.remote_dir)
-            self.ftp.delete(filename)
+        try:
+            self._breaker.call(_retry, delete_once)
             logger.info(f"✅ Image deleted from FTP: {filename}")
             return True
 
-        except Exception as e:
+        except ftplib.all_errors as e:
             logger.error(f"❌ FTP delete failed: {e}")
             return False
 
@@ -336,11 +1018,29 @@ class FTPUploader:
 
 # Singleton instance
 _ftp_uploader_instance = None
+_instance_lock = threading.Lock()
 
 
 def get_ftp_uploader() -> FTPUploader:
-    """Get singleton FTP uploader instance"""
+    """Get singleton FTP uploader instance (thread-safe)"""
     global _ftp_uploader_instance
     if _ftp_uploader_instance is None:
-        _ftp_uploader_instance = FTPUploader()
+        with _instance_lock:
+            if _ftp_uploader_instance is None:
+                _ftp_uploader_instance = FTPUploader()
     return _ftp_uploader_instance
+
+
+async def upload_images_async(local_paths: List[str]) -> List[Optional[str]]:
+    """
+    Upload several image files concurrently with asyncio (requires aioftp).
+
+    Uses the shared uploader's settings; see AsyncFTPUploader.upload_images.
+    Only plain FTP is supported (raises ValueError when tls_mode is set).
+
+    Returns:
+        FTP paths in the same order as local_paths (None for failed uploads)
+    """
+    # Imported here: aioftp is optional and the async module imports this one
+    from utils.ftp_uploader_async import AsyncFTPUploader
+    return await AsyncFTPUploader(get_ftp_uploader()).upload_images(local_paths)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Async FTP Image Uploader
+
+asyncio counterpart of FTPUploader for uploading many article images at once.
+Transfers are I/O-bound, so a single event loop can keep several uploads in
+flight without one thread per connection.
+
+Requires the optional `aioftp` package. Installing `uvloop` and calling
+`uvloop.install()` at startup further speeds up the event loop.
+Author: Manoj Konar (monoj@nexuzy.in)
+"""
+
+import asyncio
+import logging
+import os
+from typing import List, Optional
+
+try:
+    import aioftp
+    HAS_AIOFTP = True
+except ImportError:
+    HAS_AIOFTP = False
+
+from utils.ftp_uploader import FTPUploader, get_ftp_uploader
+
+logger = logging.getLogger(__name__)
+
+# Local file I/O is dispatched to a worker thread with asyncio.to_thread rather
+# than aiofiles: aiofiles sends open() and every read() to the thread pool as
+# separate hops and benchmarks slower than a plain threaded read.
+if hasattr(asyncio, 'to_thread'):
+    _to_thread = asyncio.to_thread
+else:
+    async def _to_thread(func, *args):
+        """asyncio.to_thread fallback for Python 3.8"""
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
+class AsyncFTPUploader:
+    """Uploads article images to the FTP server using asyncio"""
+
+    def __init__(self, settings: FTPUploader = None):
+        """
+        Initialize async FTP uploader.
+
+        Args:
+            settings: FTPUploader providing host, credentials, remote_dir, block
+                and pool sizes (default: the shared get_ftp_uploader() instance)
+
+        Raises:
+            ImportError: If aioftp is not installed
+            ValueError: If settings.tls_mode is not 'none' (only plain FTP is
+                supported here; use FTPUploader.upload_images for FTPS)
+        """
+        if not HAS_AIOFTP:
+            raise ImportError("aioftp is required for async FTP uploads. Install with: pip install aioftp")
+        self.settings = settings or get_ftp_uploader()
+        if self.settings.tls_mode != 'none':
+            # Refuse rather than send the credentials in cleartext
+            raise ValueError(f"Async FTP uploads do not support tls_mode '{self.settings.tls_mode}'; "
+                             "use FTPUploader.upload_images() instead")
+
+    async def upload_image(self, local_path: str, remote_filename: Optional[str] = None) -> Optional[str]:
+        """
+        Upload image file to FTP server.
+
+        Args:
+            local_path: Path to local image file
+            remote_filename: Optional custom filename (generated if not provided)
+
+        Returns:
+            FTP path (e.g., /nexuzy/article_20260121_123456.jpg), or None if upload failed
+        """
+        settings = self.settings
+        try:
+            file = await _to_thread(open, local_path, 'rb')
+        except FileNotFoundError:
+            logger.error(f"❌ Local file not found: {local_path}")
+            return None
+        except OSError as e:
+            logger.error(f"❌ Cannot open local file {local_path}: {e}")
+            return None
+
+        if not remote_filename:
+            remote_filename = FTPUploader._make_remote_filename(local_path)
+
+        try:
+            # One client per upload: aioftp clients must not be shared between tasks
+            async with aioftp.Client.context(
+                settings.host, settings.port or 21,
+                user=settings.username, password=settings.password,
+                socket_timeout=30
+            ) as client:
+                await client.change_directory(settings.remote_dir)
+
+                logger.info(f"📤 Uploading {os.path.basename(local_path)} as {remote_filename}")
+                async with client.upload_stream(remote_filename) as stream:
+                    while True:
+                        chunk = await _to_thread(file.read, settings.transfer_block_size)
+                        if not chunk:
+                            break
+                        await stream.write(chunk)
+
+            ftp_path = f"{settings.remote_dir}/{remote_filename}"
+            logger.info(f"✅ Image uploaded successfully to FTP: {ftp_path}")
+            return ftp_path
+
+        except (aioftp.StatusCodeError, OSError, asyncio.TimeoutError) as e:
+            logger.error(f"❌ FTP upload failed: {e}")
+            return None
+        finally:
+            file.close()
+
+    async def upload_images(self, local_paths: List[str]) -> List[Optional[str]]:
+        """
+        Upload several image files concurrently.
+
+        At most FTP_MAX_CONCURRENT uploads (environment variable, default:
+        pool_size) run at the same time.
+
+        Args:
+            local_paths: Paths to local image files
+
+        Returns:
+            FTP paths in the same order as local_paths (None for failed uploads)
+        """
+        max_concurrent = int(os.getenv('FTP_MAX_CONCURRENT') or self.settings.pool_size)
+        semaphore = asyncio.Semaphore(max(1, max_concurrent))
+
+        async def upload(path):
+            async with semaphore:
+                return await self.upload_image(path)
+
+        return list(await asyncio.gather(*(upload(p) for p in local_paths)))
+
+    def upload_images_sync(self, local_paths: List[str]) -> List[Optional[str]]:
+        """Blocking wrapper around upload_images() for non-async callers"""
+        return asyncio.run(self.upload_images(local_paths))
@@ -5,6 +5,32 @@ import shutil
 import uuid
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Linux ioctl that makes dst share src's extents (btrfs, XFS, bcachefs)
+_FICLONE = 0x40049409
+
+
+def _reflink(src_path: str, dst_path: Path) -> bool:
+    """Clone src into a new dst file without copying data; False if unsupported."""
+    if fcntl is None or not hasattr(fcntl, "ioctl"):
+        return False
+    try:
+        with open(src_path, "rb") as src, open(dst_path, "xb") as dst:
+            try:
+                fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+                return True
+            except OSError:
+                pass
+    except OSError:
+        return False
+    # Filesystem can't clone: remove the empty file so copy2 starts clean
+    os.unlink(dst_path)
+    return False
+
 
 def save_local_copy(src_path: str, images_dir: Path) -> str:
     """Copy src image to images_dir with unique name; return new absolute path."""
@@ -13,5 +39,10 @@ def save_local_copy(src_path: str, images_dir: Path) -> str:
     ext = os.path.splitext(src_path)[1].lower() or ".jpg"
     filename = f"{uuid.uuid4().hex}{ext}"
     dst = images_dir / filename
-    shutil.copy2(src_path, dst)
+    # Reflink is a metadata-only copy on CoW filesystems; otherwise copy2
+    # copies in-kernel (sendfile/copy_file_range) on Linux
+    if _reflink(src_path, dst):
+        shutil.copystat(src_path, dst)
+    else:
+        shutil.copy2(src_path, dst)
     return str(dst)
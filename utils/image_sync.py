@@ -7,19 +7,59 @@ Uses FTP authentication to download images (not public URLs).
 PyInstaller-safe: Uses writable cache directory from config.
 """
 
+import functools
 import os
 import sys
 import logging
 import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Optional
 
 logger = logging.getLogger(__name__)
 
+# PyInstaller-safe: use writable directory from config
+try:
+    from config import IMAGE_CACHE_DIR as _DEFAULT_CACHE_DIR
+except Exception:
+    # Fallback to current directory
+    _DEFAULT_CACHE_DIR = os.path.join(os.getcwd(), 'image_cache')
+
+# Also look for cache files named by the old MD5 scheme and rename them to
+# the current name, so existing caches are not downloaded again
+LEGACY_MD5_LOOKUP = True
+
+# Seconds before the in-memory listing of the cache directory is re-read,
+# picking up files added or removed by other processes
+FILENAME_CACHE_TTL = 60
+
+# Suffix of in-progress downloads (see FTPUploader.download_image)
+PARTIAL_SUFFIX = '.part'
+
+# Cache filename scheme: 1 = truncated MD5 (legacy), 2 = 64-bit BLAKE2b
+_HASH_VERSION = 2
+
+
+@functools.lru_cache(maxsize=8192)
+def _cache_filename(ftp_path: str, hash_version: int = _HASH_VERSION) -> str:
+    """Cache filename for an FTP path under the given naming scheme (memoized)"""
+    if hash_version == 1:
+        path_hash = hashlib.md5(ftp_path.encode()).hexdigest()[:12]
+    else:
+        path_hash = hashlib.blake2b(ftp_path.encode(), digest_size=8).hexdigest()
+    # Get file extension from path
+    ext = os.path.splitext(ftp_path)[1] or '.jpg'
+    return f"{path_hash}{ext}"
+
 
 class ImageSyncManager:
     """Manages image synchronization and local caching via FTP"""
 
+    # Cache directories already created by this process
+    _dir_ensured = set()
+
     def __init__(self, cache_dir: str = None):
         """
         Initialize image sync manager.
@@ -27,26 +67,22 @@ class ImageSyncManager:
         Args:
             cache_dir: Directory to store cached images (default: from config)
         """
-        if cache_dir is None:
-            # PyInstaller-safe: use writable directory from config
-            try:
-                import config
-                cache_dir = str(config.IMAGE_CACHE_DIR)
-            except Exception:
-                # Fallback to current directory
-                cache_dir = os.path.join(os.getcwd(), 'image_cache')
-        
-        self.cache_dir = cache_dir
+        self.cache_dir = str(cache_dir or _DEFAULT_CACHE_DIR)
         self._ensure_cache_dir()
         self.ftp = None
+        self._filename_set = None
+        self._filename_set_time = 0.0
 
     def _ensure_cache_dir(self):
-        """Create cache directory if it doesn't exist"""
+        """Create cache directory if it doesn't exist (once per process)"""
+        if self.cache_dir in self._dir_ensured:
+            return
         try:
             os.makedirs(self.cache_dir, exist_ok=True)
-            logger.info(f"Image cache directory: {self.cache_dir}")
+            self._dir_ensured.add(self.cache_dir)
+            logger.info("Image cache directory: %s", self.cache_dir)
         except Exception as e:
-            logger.error(f"Failed to create cache directory: {e}")
+            logger.error("Failed to create cache directory: %s", e)
 
     def _get_ftp(self):
         """Get FTP uploader instance (lazy load)"""
@@ -58,10 +94,53 @@ class ImageSyncManager:
     def _get_cache_filename(self, ftp_path: str) -> str:
         """Generate cache filename from FTP path"""
         # Use hash of path as filename to avoid conflicts
-        path_hash = hashlib.md5(ftp_path.encode()).hexdigest()[:12]
-        # Get file extension from path
-        ext = os.path.splitext(ftp_path)[1] or '.jpg'
-        return f"{path_hash}{ext}"
+        return _cache_filename(ftp_path, _HASH_VERSION)
+
+    def _cached_filenames(self) -> set:
+        """Names of files in the cache directory, re-read at most every FILENAME_CACHE_TTL seconds"""
+        names = self._filename_set
+        if names is None or time.monotonic() - self._filename_set_time > FILENAME_CACHE_TTL:
+            try:
+                names = {entry.name for entry in self._iter_cache_files()}
+            except OSError as e:
+                logger.error("Failed to list cache directory: %s", e)
+                names = set()
+            self._filename_set = names
+            self._filename_set_time = time.monotonic()
+        return names
+
+    def invalidate_filename_cache(self):
+        """Forget the cached directory listing; the next lookup re-reads it"""
+        self._filename_set = None
+
+    def _lookup(self, ftp_path: str) -> tuple:
+        """
+        Find the cache file for an FTP path without touching the disk.
+        
+        A file still named by the legacy MD5 scheme is renamed to the current name.
+        
+        Returns:
+            (cache_path, is_cached)
+        """
+        filename = self._get_cache_filename(ftp_path)
+        cache_path = os.path.join(self.cache_dir, filename)
+        names = self._cached_filenames()
+        if filename in names:
+            return cache_path, True
+
+        if LEGACY_MD5_LOOKUP:
+            legacy_name = _cache_filename(ftp_path, 1)
+            if legacy_name in names:
+                names.discard(legacy_name)
+                try:
+                    os.replace(os.path.join(self.cache_dir, legacy_name), cache_path)
+                except FileNotFoundError:
+                    return cache_path, False
+                names.add(filename)
+                logger.debug("Migrated cached image %s -> %s", legacy_name, filename)
+                return cache_path, True
+
+        return cache_path, False
 
     def get_cached_path(self, ftp_path: str) -> Optional[str]:
         """
@@ -76,59 +155,72 @@ class ImageSyncManager:
         if not ftp_path or not ftp_path.startswith('/'):
             return None
         
-        cache_filename = self._get_cache_filename(ftp_path)
-        cache_path = os.path.join(self.cache_dir, cache_filename)
+        cache_path, is_cached = self._lookup(ftp_path)
         
-        if os.path.exists(cache_path):
+        if is_cached:
             return cache_path
         
         return None
 
-    def download_image(self, ftp_path: str, force: bool = False) -> Optional[str]:
+    def download_image(self, ftp_path: str, force: bool = False,
+                       _skip_cache_check: bool = False) -> Optional[str]:
         """
         Download image from FTP path to local cache using FTP authentication.
         
         Args:
             ftp_path: FTP path to download (e.g., /nexuzy/article_*.jpg)
             force: Force re-download even if cached
+            _skip_cache_check: Internal; the caller has just found ftp_path uncached
             
         Returns:
             Local path to downloaded image, or None if download failed
         """
         try:
             if not ftp_path or not ftp_path.startswith('/'):
-                logger.warning(f"Invalid FTP path: {ftp_path}")
+                logger.warning("Invalid FTP path: %s", ftp_path)
                 return None
 
-            cache_filename = self._get_cache_filename(ftp_path)
-            cache_path = os.path.join(self.cache_dir, cache_filename)
+            if force or _skip_cache_check:
+                cache_filename = self._get_cache_filename(ftp_path)
+                cache_path = os.path.join(self.cache_dir, cache_filename)
+                is_cached = False
+            else:
+                cache_path, is_cached = self._lookup(ftp_path)
+                cache_filename = os.path.basename(cache_path)
 
-            # Check if already cached
-            if os.path.exists(cache_path) and not force:
-                logger.debug(f"Image already cached: {cache_filename}")
-                return cache_path
+            # Check if already cached (confirm on disk: the listing may be stale)
+            if is_cached:
+                if os.path.exists(cache_path):
+                    logger.debug("Image already cached: %s", cache_filename)
+                    return cache_path
+                self._cached_filenames().discard(cache_filename)
 
             # Download via FTP
-            logger.info(f"Downloading image via FTP: {ftp_path}")
+            logger.info("Downloading image via FTP: %s", ftp_path)
             ftp = self._get_ftp()
             
             if ftp.download_image(ftp_path, cache_path):
-                logger.info(f"Image cached: {cache_filename}")
+                self._cached_filenames().add(cache_filename)
+                logger.info("Image cached: %s", cache_filename)
                 return cache_path
             else:
-                logger.error(f"FTP download failed for: {ftp_path}")
+                logger.error("FTP download failed for: %s", ftp_path)
                 return None
 
         except Exception as e:
-            logger.error(f"Failed to download image {ftp_path}: {e}")
+            logger.error("Failed to download image %s: %s", ftp_path, e)
             return None
 
-    def sync_articles_images(self, articles: List) -> dict:
+    def sync_articles_images(self, articles: List, max_workers: int = None) -> dict:
         """
         Sync images for all articles from FTP paths.
         
+        Missing images are downloaded in parallel, each worker borrowing its
+        own connection from the FTP uploader's connection pool.
+        
         Args:
             articles: List of article objects with image_path attributes
+            max_workers: Concurrent downloads (default: FTP connection pool size)
             
         Returns:
             Dictionary with sync statistics
@@ -141,6 +233,9 @@ class ImageSyncManager:
             'no_image': 0
         }
 
+        # Articles sharing an image are checked and downloaded once; the
+        # outcome is then counted for each of them
+        pending = {}  # image_path -> number of articles waiting for it
         for article in articles:
             stats['total'] += 1
             
@@ -148,59 +243,89 @@ class ImageSyncManager:
                 stats['no_image'] += 1
                 continue
 
+            if article.image_path in pending:
+                pending[article.image_path] += 1
+                continue
+
             # Check if already cached
             cached_path = self.get_cached_path(article.image_path)
             if cached_path:
                 stats['cached'] += 1
                 continue
 
-            # Download if not cached
-            result = self.download_image(article.image_path)
-            if result:
-                stats['downloaded'] += 1
-            else:
-                stats['failed'] += 1
+            pending[article.image_path] = 1
+
+        # Download if not cached; stats are only updated from this thread
+        if pending:
+            workers = max_workers or self._get_ftp().pool_size
+            with ThreadPoolExecutor(max_workers=min(workers, len(pending))) as executor:
+                # Grouped by directory, so pooled connections (which remember
+                # their CWD) mostly stay put between files
+                futures = {executor.submit(self.download_image, path, _skip_cache_check=True): path
+                           for path in sorted(pending, key=os.path.dirname)}
+                for future in as_completed(futures):
+                    count = pending[futures[future]]
+                    if future.result():
+                        stats['downloaded'] += count
+                    else:
+                        stats['failed'] += count
 
         logger.info(
-            f"Image sync complete: {stats['downloaded']} downloaded, "
-            f"{stats['cached']} cached, {stats['failed']} failed, "
-            f"{stats['no_image']} no image"
+            "Image sync complete: %s downloaded, %s cached, %s failed, %s no image",
+            stats['downloaded'], stats['cached'], stats['failed'], stats['no_image']
         )
 
         return stats
 
+    def _iter_cache_files(self, include_partial: bool = False):
+        """
+        Yield a DirEntry for each regular file in the cache directory.
+        
+        Symlinks are skipped rather than followed, and .part files of
+        in-progress downloads are left out unless include_partial is set.
+        """
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                if not include_partial and entry.name.endswith(PARTIAL_SUFFIX):
+                    continue
+                yield entry
+
     def clear_cache(self) -> int:
         """Clear all cached images. Returns number of files deleted."""
         count = 0
         try:
-            for filename in os.listdir(self.cache_dir):
-                file_path = os.path.join(self.cache_dir, filename)
-                if os.path.isfile(file_path):
-                    os.remove(file_path)
-                    count += 1
-            logger.info(f"Cleared {count} cached images")
+            for entry in self._iter_cache_files(include_partial=True):
+                os.remove(entry.path)
+                count += 1
+            logger.info("Cleared %s cached images", count)
         except Exception as e:
-            logger.error(f"Failed to clear cache: {e}")
+            logger.error("Failed to clear cache: %s", e)
+        self.invalidate_filename_cache()
         return count
 
+    def _scan_cache(self) -> tuple:
+        """Return (file_count, total_size_bytes) from one pass over the cache directory"""
+        file_count = 0
+        total_size = 0
+        for entry in self._iter_cache_files():
+            file_count += 1
+            total_size += entry.stat(follow_symlinks=False).st_size
+        return file_count, total_size
+
     def get_cache_size(self) -> int:
         """Get total size of cached images in bytes"""
-        total_size = 0
         try:
-            for filename in os.listdir(self.cache_dir):
-                file_path = os.path.join(self.cache_dir, filename)
-                if os.path.isfile(file_path):
-                    total_size += os.path.getsize(file_path)
+            return self._scan_cache()[1]
         except Exception as e:
-            logger.error(f"Failed to get cache size: {e}")
-        return total_size
+            logger.error("Failed to get cache size: %s", e)
+            return 0
 
     def get_cache_stats(self) -> dict:
         """Get cache statistics"""
         try:
-            files = os.listdir(self.cache_dir)
-            file_count = len([f for f in files if os.path.isfile(os.path.join(self.cache_dir, f))])
-            total_size = self.get_cache_size()
+            file_count, total_size = self._scan_cache()
             
             return {
                 'file_count': file_count,
@@ -208,17 +333,20 @@ class ImageSyncManager:
                 'total_size_mb': round(total_size / (1024 * 1024), 2)
             }
         except Exception as e:
-            logger.error(f"Failed to get cache stats: {e}")
+            logger.error("Failed to get cache stats: %s", e)
             return {'file_count': 0, 'total_size_bytes': 0, 'total_size_mb': 0}
 
 
 # Singleton instance
 _image_sync_instance = None
+_instance_lock = threading.Lock()
 
 
 def get_image_sync() -> ImageSyncManager:
-    """Get singleton image sync manager instance"""
+    """Get singleton image sync manager instance (thread-safe)"""
     global _image_sync_instance
     if _image_sync_instance is None:
-        _image_sync_instance = ImageSyncManager()
+        with _instance_lock:
+            if _image_sync_instance is None:
+                _image_sync_instance = ImageSyncManager()
     return _image_sync_instance
@@ -7,8 +7,10 @@ This module provides:
 - Logger: small wrapper class used across the app (backward compatible)
 """
 
+import atexit
 import logging
 import logging.handlers
+import queue
 from datetime import datetime
 
 from config import LOGS_DIR, APP_NAME
@@ -31,7 +33,8 @@ def setup_logger(name: str = APP_NAME) -> logging.Logger:
     file_handler = logging.handlers.RotatingFileHandler(
         log_file,
         maxBytes=10 * 1024 * 1024,  # 10MB
-        backupCount=5
+        backupCount=5,
+        delay=True  # Open the file on the first record
     )
     file_handler.setLevel(logging.DEBUG)
 
@@ -48,8 +51,16 @@ def setup_logger(name: str = APP_NAME) -> logging.Logger:
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
 
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Callers only enqueue records; a listener thread does the file and
+    # console I/O, so worker threads never block on the handler locks
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)  # Flushes queued records on exit
+
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     logger._nexuzy_configured = True
     return logger
@@ -7,17 +7,48 @@ Exports:
 - is_online(): functional helper (kept for compatibility)
 """
 
+import os
 import socket
 import logging
+import struct
+import threading
+import time
 from config import INTERNET_CHECK_TIMEOUT
 
 logger = logging.getLogger(__name__)
 
+# A probe result is reused for this many seconds; while offline the window
+# doubles after each failed probe, up to OFFLINE_RECHECK_MAX
+ONLINE_CACHE_TTL = 5.0
+OFFLINE_RECHECK_MAX = 30.0
 
-def is_online(timeout: int = INTERNET_CHECK_TIMEOUT) -> bool:
-    """Check if internet connection is available (Google DNS ping)."""
+DNS_SERVER = ("8.8.8.8", 53)
+
+_check_lock = threading.Lock()
+# deep flag -> [last check time, last result, reuse window]
+_check_state = {}
+
+
+def _dns_query(query_id: bytes) -> bytes:
+    """Build a recursive DNS query for the A record of google.com."""
+    header = query_id + struct.pack(">HHHHH", 0x0100, 1, 0, 0, 0)
+    question = b"\x06google\x03com\x00" + struct.pack(">HH", 1, 1)
+    return header + question
+
+
+def _probe(timeout: int, deep: bool) -> bool:
+    """Check for a route to Google DNS over UDP, or ask it a query if deep."""
     try:
-        socket.create_connection(("8.8.8.8", 53), timeout=timeout)
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.settimeout(timeout)
+            # connect() on UDP sends nothing; it fails without a route
+            sock.connect(DNS_SERVER)
+            if deep:
+                query_id = os.urandom(2)
+                sock.send(_dns_query(query_id))
+                reply = sock.recv(512)
+                if reply[:2] != query_id or not reply[2] & 0x80:
+                    raise OSError("unexpected DNS reply")
         logger.debug("Internet connection available")
         return True
     except (OSError, socket.timeout):
@@ -25,25 +56,51 @@ def is_online(timeout: int = INTERNET_CHECK_TIMEOUT) -> bool:
         return False
 
 
+def is_online(timeout: int = INTERNET_CHECK_TIMEOUT, deep: bool = False) -> bool:
+    """Check if internet connection is available (Google DNS ping).
+
+    By default only checks that a route to the DNS server exists, which
+    costs no network round-trip. With deep=True a DNS query is sent and
+    answered, proving the internet is actually reachable.
+
+    The answer is cached for a few seconds, and concurrent callers share
+    one probe.
+    """
+    with _check_lock:
+        state = _check_state.setdefault(deep, [None, False, ONLINE_CACHE_TTL])
+        last_check, last_result, ttl = state
+        if last_check is not None and time.monotonic() - last_check < ttl:
+            return last_result
+
+        result = _probe(timeout, deep)
+        ttl = ONLINE_CACHE_TTL if result else min(ttl * 2, OFFLINE_RECHECK_MAX)
+        state[:] = [time.monotonic(), result, ttl]
+        return result
+
+
 class NetworkChecker:
-    """Backward-compatible checker used across the app."""
+    """Backward-compatible checker used across the app.
+
+    Uses the deep (DNS query) probe: a route alone does not mean Firebase is
+    reachable, e.g. on a LAN without internet.
+    """
 
     def __init__(self, timeout: int = INTERNET_CHECK_TIMEOUT):
         self.timeout = timeout
 
     def is_connected(self) -> bool:
-        return is_online(self.timeout)
+        return is_online(self.timeout, deep=True)
 
     def is_online(self) -> bool:
-        return is_online(self.timeout)
+        return is_online(self.timeout, deep=True)
 
 
 def check_firebase_connection(firebase_app) -> bool:
     """Verify Firebase connectivity (basic)."""
     try:
-        if not is_online():
+        if not is_online(deep=True):
             return False
         return True
     except Exception as e:
-        logger.error(f"Firebase connection check failed: {e}")
+        logger.error("Firebase connection check failed: %s", e)
         return False
@@ -3,15 +3,47 @@ Security utilities for password hashing and encryption
 Author: Manoj Konar (monoj@nexuzy.in)
 """
 
-from werkzeug.security import generate_password_hash, check_password_hash
-from cryptography.fernet import Fernet
+import functools
 import logging
+import string
 
 logger = logging.getLogger(__name__)
 
+
+# Argon2id cost parameters for new password hashes
+ARGON2_TIME_COST = 2
+ARGON2_MEMORY_COST = 64 * 1024  # KiB
+ARGON2_PARALLELISM = 2
+
+_ASCII_LETTERS = frozenset(string.ascii_letters)
+_ASCII_DIGITS = frozenset(string.digits)
+
+
+@functools.lru_cache(maxsize=None)
+def _werkzeug_security():
+    """Import werkzeug.security on first use (keeps module import cheap)"""
+    from werkzeug import security
+    return security
+
+
+@functools.lru_cache(maxsize=None)
+def _argon2_hasher():
+    """Return an Argon2id PasswordHasher, or None if argon2-cffi is not installed"""
+    try:
+        from argon2 import PasswordHasher
+    except ImportError:
+        logger.warning("argon2-cffi not installed, falling back to pbkdf2:sha256 password hashes")
+        return None
+    return PasswordHasher(time_cost=ARGON2_TIME_COST, memory_cost=ARGON2_MEMORY_COST,
+                          parallelism=ARGON2_PARALLELISM)
+
+
+def _is_argon2_hash(password_hash):
+    return password_hash.startswith('$argon2')
+
 def hash_password(password):
     """
-    Hash a password using werkzeug
+    Hash a password using Argon2id (werkzeug pbkdf2:sha256 if argon2-cffi is missing)
     
     Args:
         password: Plain text password
@@ -20,7 +52,10 @@ def hash_password(password):
         str: Hashed password
     """
     try:
-        return generate_password_hash(password, method='pbkdf2:sha256')
+        hasher = _argon2_hasher()
+        if hasher is not None:
+            return hasher.hash(password)
+        return _werkzeug_security().generate_password_hash(password, method='pbkdf2:sha256')
     except Exception as e:
         logger.error(f"Password hashing failed: {e}")
         return None
@@ -29,6 +64,8 @@ def verify_password(password, password_hash):
     """
     Verify a password against its hash
     
+    Accepts Argon2 hashes and legacy werkzeug (pbkdf2/scrypt) hashes.
+    
     Args:
         password: Plain text password
         password_hash: Hashed password
@@ -37,11 +74,42 @@ def verify_password(password, password_hash):
         bool: True if password matches
     """
     try:
-        return check_password_hash(password_hash, password)
+        if _is_argon2_hash(password_hash):
+            hasher = _argon2_hasher()
+            if hasher is None:
+                logger.error("Password verification failed: argon2-cffi is required for Argon2 hashes")
+                return False
+            from argon2.exceptions import VerificationError, InvalidHashError
+            try:
+                return hasher.verify(password_hash, password)
+            except (VerificationError, InvalidHashError):
+                return False
+        return _werkzeug_security().check_password_hash(password_hash, password)
     except Exception as e:
         logger.error(f"Password verification failed: {e}")
         return False
 
+def needs_rehash(password_hash):
+    """
+    Check whether a stored hash should be replaced with a fresh Argon2id hash
+    
+    Args:
+        password_hash: Hashed password
+        
+    Returns:
+        bool: True for legacy werkzeug hashes or outdated Argon2 parameters
+    """
+    hasher = _argon2_hasher()
+    if hasher is None:
+        return False
+    if not _is_argon2_hash(password_hash):
+        return True
+    try:
+        return hasher.check_needs_rehash(password_hash)
+    except Exception as e:
+        logger.error(f"Password rehash check failed: {e}")
+        return False
+
 def validate_password_strength(password):
     """
     Validate password strength
@@ -55,8 +123,13 @@ def validate_password_strength(password):
     if len(password) < 6:
         return False, "Password must be at least 6 characters"
     
-    has_letter = any(c.isalpha() for c in password)
-    has_number = any(c.isdigit() for c in password)
+    # Set checks run in C; non-ASCII passwords fall back to the per-character
+    # test so Unicode letters/digits still count
+    has_letter = not _ASCII_LETTERS.isdisjoint(password)
+    has_number = not _ASCII_DIGITS.isdisjoint(password)
+    if not password.isascii():
+        has_letter = has_letter or any(c.isalpha() for c in password)
+        has_number = has_number or any(c.isdigit() for c in password)
     
     if not has_letter or not has_number:
         return False, "Password must contain letters and numbers"